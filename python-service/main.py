@@ -1,11 +1,12 @@
 from datetime import datetime
+import numpy as np
 import polars as pl
-from src.spaced_rep import add_new_topic, update_entry, grab_revision_list
+from src.spaced_rep import add_new_topic, update_entry, grab_revision_list, SRSession
 from datetime import timedelta
 
 # Setup test files
-SEEN_PATH = "./data/seen.csv"
-REVISIONS_PATH = "./data/revisions.csv"
+SEEN_PATH = "./data/seen.parquet"
+REVISIONS_PATH = "./data/revisions.parquet"
 
 def test_add_new_topic():
     print("\n==== Test: add_new_topic ====")
@@ -15,13 +16,13 @@ def test_add_new_topic():
     
     add_new_topic(topic=topic, date=date, url=url)
     
-    seen_df = pl.read_csv(SEEN_PATH)
+    seen_df = pl.read_parquet(SEEN_PATH)
     assert topic in seen_df["topic"].to_list(), "Topic not added to seen.csv"
 
-    rev_df = pl.read_csv(REVISIONS_PATH)
-    future_dates = [(datetime.strptime(date, "%Y-%m-%d") + timedelta(days=2 ** i)).strftime("%Y-%m-%d") for i in range(9)]
+    rev_df = pl.read_parquet(REVISIONS_PATH)
+    future_dates = set((np.datetime64(date) + (1 << np.arange(9)).astype("timedelta64[D]")).tolist())
     rev_dates_for_topic = rev_df.filter(pl.col("topic") == topic)["date"].to_list()
-    assert set(future_dates).issubset(set(rev_dates_for_topic)), "Revision schedule not created correctly"
+    assert future_dates.issubset(set(rev_dates_for_topic)), "Revision schedule not created correctly"
 
 def test_update_existing_topic():
     print("\n==== Test: update_entry ====")
@@ -31,13 +32,13 @@ def test_update_existing_topic():
 
     update_entry(topic=topic, date_to_remove_from=date_to_reset, reset_rate=reset_rate)
 
-    seen_df = pl.read_csv(SEEN_PATH)
+    seen_df = pl.read_parquet(SEEN_PATH)
     updated_row = seen_df.filter(pl.col("topic") == topic).row(0)
     assert updated_row[1] == date_to_reset, "Seen date not updated"
     assert updated_row[3] == reset_rate, "Reset index not updated"
 
-    rev_df = pl.read_csv(REVISIONS_PATH)
-    expected_new_date = (datetime.strptime(date_to_reset, "%Y-%m-%d") + timedelta(days=2 ** reset_rate)).strftime("%Y-%m-%d")
+    rev_df = pl.read_parquet(REVISIONS_PATH)
+    expected_new_date = (datetime.strptime(date_to_reset, "%Y-%m-%d") + timedelta(days=2 ** reset_rate)).date()
     assert expected_new_date in rev_df["date"].to_list(), "New revision entry missing"
 
 def test_grab_revision_list():
@@ -61,11 +62,12 @@ def run_tests():
 
 if __name__ == "__main__":
     #run_tests()
-    add_new_topic("concurrency_multi_threading_python", "2025-06-29")
-    add_new_topic("leetcode_two_sum", "2025-06-29", "https://leetcode.com/problems/two-sum/description/")
-    
-    add_new_topic("concurrency_multi_threading_python", "2025-06-29") # should throw warning
-    
-    grab_revision_list()
-    print("\n----------------------------------------------")
-    grab_revision_list("2025-06-30")
\ No newline at end of file
+    with SRSession() as s:
+        add_new_topic("concurrency_multi_threading_python", "2025-06-29", session=s)
+        add_new_topic("leetcode_two_sum", "2025-06-29", "https://leetcode.com/problems/two-sum/description/", session=s)
+
+        add_new_topic("concurrency_multi_threading_python", "2025-06-29", session=s) # should throw warning
+
+        grab_revision_list(session=s)
+        print("\n----------------------------------------------")
+        grab_revision_list("2025-06-30", session=s)
\ No newline at end of file